@@ -2,16 +2,46 @@
 import sys
 import os
 import re
+import stat
+import mmap
 import logging
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Keys should only contain word chars, spaces, and hyphens
+_KEY_INVALID_RE = re.compile(r'[^\w\s-]')
+
+# One match per line: leading whitespace and the remainder of the line. Lines
+# end in \n, \r\n or \r, the same universal newlines as text-mode reads.
+_LINE_RE = re.compile(r'(?P<indent>[^\S\r\n]*)(?P<body>[^\r\n]*)(?:\r\n?|\n|$)')
+
+# Bytes counterparts of the patterns above, used to check pure ASCII content
+# without decoding it. \x1c-\x1f are listed explicitly so that whitespace
+# matches what str.isspace() accepts.
+_ASCII_SPACE = b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'
+_KEY_INVALID_RE_B = re.compile(rb'[^\w\s\x1c-\x1f-]')
+_LINE_RE_B = re.compile(rb'(?P<indent>[ \t\x0b\x0c\x1c-\x1f]*)(?P<body>[^\r\n]*)(?:\r\n?|\n|$)')
+_NON_ASCII_RE_B = re.compile(rb'[\x80-\xff]')
+
+# Syntax check results keyed by (path, mtime_ns, size), so repeated or
+# unchanged files are not read and checked again
+_VALIDATION_CACHE = {}
+
+# Set once setup_logging() has installed its handlers
+_LOGGING_READY = False
+
 # Configure logging
 def setup_logging():
     """
     Configure logging for the script.
     Sets up logging to both console and a log file.
+    Safe to call more than once; handlers are only installed on the first call.
     """
+    global _LOGGING_READY
+    if _LOGGING_READY:
+        return logging.getLogger()
+    
     # Create logs directory if it doesn't exist
     script_dir = Path(__file__).parent.absolute()
     log_dir = script_dir / "logs"
@@ -40,127 +70,169 @@ def setup_logging():
     # Add handlers to logger
     logger.addHandler(file_handler)
     logger.addHandler(console_handler)
+    _LOGGING_READY = True
     
     logging.info(f"Logging initialized. Log file: {log_file}")
     return logger
 
-# Initialize logging
-logger = setup_logging()
+def report_line(report, message):
+    """
+    Add a line to the report written to stdout.
+    
+    Args:
+        report (list): Lines collected for the caller to write, or None to print directly
+        message (str): Line to report
+    """
+    if report is None:
+        print(message)
+    else:
+        report.append(message)
 
-def validate_absolute_path(filepath):
+def validate_absolute_path(filepath, report=None):
     """
     Validate that a filepath is an absolute path.
     
     Args:
         filepath (str): Path to validate
+        report (list): Lines collected for the stdout report, or None to print directly
         
     Returns:
         bool: True if filepath is an absolute path, False otherwise
     """
-    logging.debug(f"Validating absolute path: '{filepath}'")
+    logging.debug("Validating absolute path: '%s'", filepath)
     if not os.path.isabs(filepath):
         logging.error(f"File path '{filepath}' is not an absolute path")
-        print(f"Error: File path '{filepath}' is not an absolute path.")
+        report_line(report, f"Error: File path '{filepath}' is not an absolute path.")
         return False
-    logging.debug(f"Path '{filepath}' is absolute")
+    logging.debug("Path '%s' is absolute", filepath)
     return True
 
-def validate_file_size(filepath, max_size_bytes=1048576):  # 1 MB = 1048576 bytes
+def validate_file_size(filepath, max_size_bytes=1048576, report=None):  # 1 MB = 1048576 bytes
     """
     Validate that a file's size is less than the specified maximum size.
     
     Args:
         filepath (str): Path to the file to validate
         max_size_bytes (int): Maximum allowed file size in bytes (default: 1 MB)
+        report (list): Lines collected for the stdout report, or None to print directly
         
     Returns:
         bool: True if file size is less than max_size_bytes, False otherwise
     """
-    logging.debug(f"Validating file size for '{filepath}', max size: {max_size_bytes} bytes")
+    logging.debug("Validating file size for '%s', max size: %d bytes", filepath, max_size_bytes)
     try:
         file_size = os.path.getsize(filepath)
-        logging.debug(f"File '{filepath}' size: {file_size} bytes")
-        if file_size > max_size_bytes:
-            logging.error(f"File '{filepath}' exceeds the maximum allowed size of 1 MB. File size: {file_size} bytes")
-            print(f"Error: File '{filepath}' exceeds the maximum allowed size of 1 MB. File size: {file_size} bytes.")
-            return False
-        logging.debug(f"File '{filepath}' size is within limits")
-        return True
+        return check_size_limit(filepath, file_size, max_size_bytes, report)
     except OSError as e:
         logging.error(f"Error checking file size for '{filepath}': {e}")
-        print(f"Error checking file size for '{filepath}': {e}")
+        report_line(report, f"Error checking file size for '{filepath}': {e}")
         return False
 
+def check_size_limit(filepath, file_size, max_size_bytes=1048576, report=None):  # 1 MB = 1048576 bytes
+    """
+    Validate an already known file size against the specified maximum size.
+    
+    Args:
+        filepath (str): Path of the file, used for reporting
+        file_size (int): Size of the file in bytes
+        max_size_bytes (int): Maximum allowed file size in bytes (default: 1 MB)
+        report (list): Lines collected for the stdout report, or None to print directly
+        
+    Returns:
+        bool: True if file_size is less than max_size_bytes, False otherwise
+    """
+    logging.debug("File '%s' size: %d bytes", filepath, file_size)
+    if file_size > max_size_bytes:
+        logging.error(f"File '{filepath}' exceeds the maximum allowed size of 1 MB. File size: {file_size} bytes")
+        report_line(report, f"Error: File '{filepath}' exceeds the maximum allowed size of 1 MB. File size: {file_size} bytes.")
+        return False
+    logging.debug("File '%s' size is within limits", filepath)
+    return True
+
 def basic_yaml_syntax_check(content):
     """
     Perform a basic syntax check for YAML content.
     
     Args:
-        content (str): YAML content to validate
+        content (str or bytes-like): YAML content to validate; bytes-like
+            content must be pure ASCII
         
     Returns:
         tuple: (is_valid, error_message)
     """
     logging.debug("Starting YAML syntax check")
-    lines = content.split('\n')
-    indentation_stack = []
+    if isinstance(content, str):
+        line_re, find_invalid_key_char = _LINE_RE, _KEY_INVALID_RE.search
+        colon, tab, comment, dash, space = ':', '\t', '#', '-', None
+    else:
+        # Indexing bytes yields ints, so single characters compare as ordinals
+        line_re, find_invalid_key_char = _LINE_RE_B, _KEY_INVALID_RE_B.search
+        colon, tab, comment, dash, space = b':', b'\t', ord('#'), ord('-'), _ASCII_SPACE
+    
+    # Bit n is set when indentation level n is open (the current level or
+    # one of its parents); level 0 is always open
+    open_levels = 1
     current_indent = 0
     
-    for line_num, line in enumerate(lines, 1):
+    # Each match is one line, split into its leading whitespace and the rest
+    for line_num, match in enumerate(line_re.finditer(content), 1):
+        body = match['body']
+        
         # Skip empty lines and comments
-        stripped = line.strip()
-        if not stripped or stripped.startswith('#'):
+        if not body or body[0] == comment:
             continue
         
-        # Check indentation
-        indent = len(line) - len(line.lstrip())
+        # Check indentation. The regex has already split off the leading
+        # whitespace, so no lstrip() copy is needed to measure it.
+        leading = match['indent']
+        indent = len(leading)
         
         # Check for common YAML syntax errors
-        if ':' not in line and not line.strip().startswith('-'):
-            if line.strip() and not line.strip().startswith('#'):
-                error_msg = f"Line {line_num}: Missing colon in key-value pair or not a list item"
-                logging.error(f"YAML syntax error: {error_msg}")
-                return False, error_msg
+        has_colon = colon in body
+        if not has_colon and body[0] != dash:
+            error_msg = f"Line {line_num}: Missing colon in key-value pair or not a list item"
+            logging.error(f"YAML syntax error: {error_msg}")
+            return False, error_msg
         
         # Check for invalid characters in keys
-        if ':' in line:
-            key = line.split(':', 1)[0].strip()
-            if re.search(r'[^\w\s-]', key):  # Keys should only contain word chars, spaces, and hyphens
+        if has_colon:
+            key = body.partition(colon)[0].rstrip(space)
+            if find_invalid_key_char(key):
+                if not isinstance(key, str):
+                    key = key.decode('ascii')
                 error_msg = f"Line {line_num}: Invalid character in key '{key}'"
                 logging.error(f"YAML syntax error: {error_msg}")
                 return False, error_msg
         
         # Check for tab characters (YAML doesn't allow tabs)
-        if '\t' in line:
+        if tab in leading or tab in body:
             error_msg = f"Line {line_num}: Tab character found (YAML uses spaces for indentation)"
             logging.error(f"YAML syntax error: {error_msg}")
             return False, error_msg
         
         # Check for inconsistent indentation
         if indent > current_indent:
-            indentation_stack.append(current_indent)
+            open_levels |= 1 << indent
             current_indent = indent
         elif indent < current_indent:
-            if indent not in indentation_stack:
-                error_msg = f"Line {line_num}: Inconsistent indentation"
-                logging.error(f"YAML syntax error: {error_msg}")
-                return False, error_msg
-            while indentation_stack and indent < current_indent:
-                current_indent = indentation_stack.pop()
-            if indent != current_indent:
+            if not (open_levels >> indent) & 1:
                 error_msg = f"Line {line_num}: Inconsistent indentation"
                 logging.error(f"YAML syntax error: {error_msg}")
                 return False, error_msg
+            # Close every level deeper than the one returned to
+            open_levels &= (1 << (indent + 1)) - 1
+            current_indent = indent
     
     logging.debug("YAML syntax check completed successfully")
     return True, ""
 
-def validate_yaml_file(filepath):
+def validate_yaml_file(filepath, report=None):
     """
     Validate that a file exists and contains valid YAML.
     
     Args:
         filepath (str): Path to the file to validate
+        report (list): Lines collected for the stdout report, or None to print directly
         
     Returns:
         bool: True if file exists and contains valid YAML, False otherwise
@@ -168,45 +240,80 @@ def validate_yaml_file(filepath):
     logging.info(f"Validating YAML file: '{filepath}'")
     
     # Check if file path is absolute
-    if not validate_absolute_path(filepath):
+    if not validate_absolute_path(filepath, report):
         logging.warning(f"Validation failed: '{filepath}' is not an absolute path")
         return False
         
-    # Check if file exists
-    if not os.path.isfile(filepath):
+    # Check if file exists, fetching its metadata with a single stat call
+    try:
+        st = os.stat(filepath)
+    except FileNotFoundError:
         logging.error(f"Validation failed: File '{filepath}' does not exist")
-        print(f"Error: File '{filepath}' does not exist.")
+        report_line(report, f"Error: File '{filepath}' does not exist.")
+        return False
+    except PermissionError:
+        logging.error(f"Validation failed: No permission to access file '{filepath}'")
+        report_line(report, f"Error: No permission to access file '{filepath}'.")
+        return False
+    except OSError as e:
+        logging.error(f"Validation failed: Could not access file '{filepath}': {e}")
+        report_line(report, f"Error: Could not access file '{filepath}': {e}")
+        return False
+    if not stat.S_ISREG(st.st_mode):
+        logging.error(f"Validation failed: File '{filepath}' is not a regular file")
+        report_line(report, f"Error: File '{filepath}' is not a regular file.")
         return False
     
     # Check if file size is less than 1 MB
-    if not validate_file_size(filepath):
+    if not check_size_limit(filepath, st.st_size, report=report):
         logging.warning(f"Validation failed: File '{filepath}' exceeds size limit")
         return False
     
-    # Try to read and parse the file as YAML
-    try:
-        logging.debug(f"Reading file: '{filepath}'")
-        with open(filepath, 'r', encoding='utf-8') as file:
-            content = file.read()
-            logging.debug(f"File read successfully, performing YAML syntax check")
-            is_valid, error_message = basic_yaml_syntax_check(content)
-            
-            if is_valid:
-                logging.info(f"Validation successful: '{filepath}' is a valid YAML file")
-                print(f"Success: '{filepath}' is a valid YAML file.")
-                return True
-            else:
-                logging.error(f"Validation failed: '{filepath}' is not a valid YAML file: {error_message}")
-                print(f"Error: '{filepath}' is not a valid YAML file: {error_message}")
-                return False
-    except Exception as e:
-        logging.error(f"Error reading file '{filepath}': {e}")
-        print(f"Error reading file '{filepath}': {e}")
+    # Reuse the result of an earlier check if the file has not changed since
+    cache_key = (filepath, st.st_mtime_ns, st.st_size)
+    cached = _VALIDATION_CACHE.get(cache_key)
+    if cached is not None:
+        logging.debug("Using cached validation result for '%s'", filepath)
+        is_valid, error_message = cached
+    else:
+        # Try to read and parse the file as YAML
+        try:
+            logging.debug("Reading file: '%s'", filepath)
+            with open(filepath, 'rb') as file:
+                # mmap refuses zero-length files, which are trivially valid YAML
+                if st.st_size == 0:
+                    is_valid, error_message = True, ""
+                else:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        logging.debug("File read successfully, performing YAML syntax check")
+                        if _NON_ASCII_RE_B.search(mapped) is None:
+                            # Pure ASCII: check the mapped bytes without decoding
+                            is_valid, error_message = basic_yaml_syntax_check(mapped)
+                        else:
+                            is_valid, error_message = basic_yaml_syntax_check(str(mapped, 'utf-8'))
+        except Exception as e:
+            logging.error(f"Error reading file '{filepath}': {e}")
+            report_line(report, f"Error reading file '{filepath}': {e}")
+            return False
+        _VALIDATION_CACHE[cache_key] = (is_valid, error_message)
+    
+    if is_valid:
+        logging.info(f"Validation successful: '{filepath}' is a valid YAML file")
+        report_line(report, f"Success: '{filepath}' is a valid YAML file.")
+        return True
+    else:
+        logging.error(f"Validation failed: '{filepath}' is not a valid YAML file: {error_message}")
+        report_line(report, f"Error: '{filepath}' is not a valid YAML file: {error_message}")
         return False
 
 def main():
+    setup_logging()
     logging.info("Script started")
     
+    # The report on stdout is block buffered and flushed once at the end
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     # Check if a filename was provided
     if len(sys.argv) != 2:
         logging.error("No input filename provided")
@@ -231,24 +338,51 @@ def main():
     print("-" * 50)
     
     try:
-        with open(input_filename, 'r', encoding='utf-8') as file:
-            logging.debug(f"File '{input_filename}' opened successfully")
-            file_lines = file.readlines()
-            logging.info(f"Read {len(file_lines)} lines from '{input_filename}'")
-            
-            for line_number, line in enumerate(file_lines, 1):
-                # Strip whitespace
-                filepath = line.strip()
+        # Files are independent, so validate them concurrently to overlap I/O.
+        # Each entry keeps its own report so output stays in input order.
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        entries = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            with open(input_filename, 'r', encoding='utf-8') as file:
+                logging.debug("File '%s' opened successfully", input_filename)
+                line_number = 0
                 
-                # Skip empty lines
-                if not filepath:
-                    logging.debug(f"Line {line_number}: Empty line, skipping")
-                    continue
+                for line_number, line in enumerate(file, 1):
+                    # Strip whitespace
+                    filepath = line.strip()
+                    
+                    # Skip empty lines
+                    if not filepath:
+                        logging.debug("Line %d: Empty line, skipping", line_number)
+                        continue
+                    
+                    # Skip comment lines
+                    if filepath[0] == '#':
+                        logging.debug("Line %d: Comment, skipping", line_number)
+                        continue
+                    
+                    logging.info(f"Processing line {line_number}: '{filepath}'")
+                    report = []
+                    
+                    # Reject relative paths up front rather than handing them to a worker
+                    if filepath[0] != '/':
+                        logging.error(f"File path '{filepath}' is not an absolute path")
+                        report_line(report, f"Error: File path '{filepath}' is not an absolute path.")
+                        entries.append((line_number, filepath, report, None))
+                        continue
+                    
+                    future = executor.submit(validate_yaml_file, filepath, report)
+                    entries.append((line_number, filepath, report, future))
                 
-                logging.info(f"Processing line {line_number}: '{filepath}'")
+                logging.info(f"Read {line_number} lines from '{input_filename}'")
+            
+            for line_number, filepath, report, future in entries:
+                is_valid = future is not None and future.result()
                 print(f"Line {line_number}: {filepath}")
+                for message in report:
+                    print(message)
                 
-                if validate_yaml_file(filepath):
+                if is_valid:
                     logging.info(f"Validation successful for '{filepath}'")
                     success_count += 1
                 else:
@@ -275,6 +409,7 @@ def main():
     # Print summary
     logging.info(f"Processing completed. Summary: {success_count} valid YAML files, {error_count} errors")
     print(f"Summary: {success_count} valid YAML files, {error_count} errors")
+    sys.stdout.flush()
     
     logging.info("Script completed successfully")
 
@@ -2,25 +2,30 @@
 import json
 import os
 
-# Create a large JSON object
-large_json = {
+# Header of a large JSON object; the items are streamed in below
+header = {
     "name": "Large Test JSON",
     "version": 1.0,
     "description": "A large JSON file for testing file size validation",
-    "items": []
 }
 
-# Add many items to make the file larger than 1 MB
-for i in range(50000):
-    large_json["items"].append({
-        "id": i,
-        "value": f"item_{i}" * 20  # Repeat the string to make it larger
-    })
 
-# Write to file
-with open('large.json', 'w') as f:
-    json.dump(large_json, f)
+def items(count):
+    """Yield each item as pre-encoded JSON bytes, comma-separated."""
+    for i in range(count):
+        value = (b"item_%d" % i) * 20  # Repeat the string to make it larger
+        yield b'%s{"id": %d, "value": "%s"}' % (b", " if i else b"", i, value)
+
+
+# Write to file, one item at a time so the whole object is never held in memory
+with open('large.json', 'wb') as f:
+    f.write(json.dumps(header)[:-1].encode() + b', "items": [')
+
+    # Add many items to make the file larger than 1 MB
+    f.writelines(items(50000))
+
+    f.write(b']}')
 
 # Verify file size
 file_size = os.path.getsize('large.json')
-print(f"Created large.json with size: {file_size} bytes ({file_size / 1024 / 1024:.2f} MB)")
\ No newline at end of file
+print(f"Created large.json with size: {file_size} bytes ({file_size / 1024 / 1024:.2f} MB)")